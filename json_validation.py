@@ -1,6 +1,24 @@
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor
 
-from validator import *
+try:
+  import orjson
+except ImportError:
+  orjson = None
+
+from validator import (BooleanValidator, NumberArrayValidator, NumberOrNumberArrayValidator,
+                       NumberValidator, StringValidator)
+
+# Messages recorded for fields absent from the input; validator messages are formatted once
+# when each validator is constructed
+MISSING_REQUIRED_MSG = "Missing required parameter"
+RECOMMENDED_MSG = "Recommended to be specified"
+
+# orjson can only indent by two spaces. Doubling the leading spaces of each line restores the
+# four-space layout of the report files. JSON strings cannot hold a raw newline, so every
+# newline in the output starts a new line of the layout.
+_ORJSON_INDENT = re.compile(rb"\n( +)")
 
 
 class JSONValidator:
@@ -10,129 +28,180 @@ class JSONValidator:
     self.required_condition_schema = required_condition_schema
     self.recommended_validator_schema = recommended_validator_schema
     self.recommended_condition_schema = recommended_condition_schema
+    # The schemas are fixed once the validator is built, so resolve each field's condition
+    # up front and lay required then recommended fields out in one plan that validate() walks
+    # in a single pass
+    self._plan = (self.build_plan(required_validator_schema, required_condition_schema, True) +
+                  self.build_plan(recommended_validator_schema, recommended_condition_schema,
+                                  False))
 
   def read_json(self, file_path: str):
     try:
-      with open(file_path, 'r') as file:
-        data = json.load(file)
+      data = load_json(file_path)
       return data, None
     except Exception as e:
       return None, f"Error reading file: {str(e)}"
 
+  def validate_file(self, file_path):
+    data, error = self.read_json(file_path)
+    if error is not None:
+      return None, error
+    try:
+      return self.validate(data), None
+    except Exception as e:
+      # A malformed sidecar (e.g. a top-level array, or a string where a number is expected)
+      # is reported like an unreadable one rather than aborting a whole batch
+      return None, f"Error validating file: {str(e)}"
+
+  def validate_many(self, file_paths, max_workers=None):
+    # Returns one (result, error) pair per path, in the order given, for read and validation
+    # failures alike. File reads release the GIL, so reading a batch of sidecars overlaps
+    # across threads.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+      return list(executor.map(self.validate_file, file_paths))
+
+  @staticmethod
+  def build_plan(validator_schema, condition_schema, is_required):
+    # Default to "all" if no specific condition is set
+    # Store the bound validate method so the validation loop skips the attribute lookup
+    return [(field, validator.validate,
+             JSONValidator.compile_condition(condition_schema.get(field, "all")), is_required)
+            for field, validator in validator_schema.items()]
+
+  @staticmethod
+  def compile_condition(condition):
+    # Turn a condition into a predicate over the input data once, instead of walking the
+    # condition dict for every field on every validation
+    if not isinstance(condition, dict):
+      return lambda data: True
+    checks = []
+    for key, value in condition.items():
+      if isinstance(value, list):
+        # A tuple rather than a set, as the input value may be unhashable
+        checks.append(lambda data, key=key, allowed=tuple(value): data.get(key) in allowed)
+      else:
+        checks.append(lambda data, key=key, expected=value: data.get(key) == expected)
+    if len(checks) == 1:
+      return checks[0]
+    return lambda data: all(check(data) for check in checks)
+
   def validate(self, data):
     errors, warnings, values = {}, {}, {}
-    # Handle required fields
-    self.apply_schema(self.required_validator_schema, self.required_condition_schema, data, errors,
-                      warnings, values, True)
-    # Handle recommended fields
-    self.apply_schema(self.recommended_validator_schema, self.recommended_condition_schema, data,
-                      errors, warnings, values, False)
+    for field, validate_field, applies, is_required in self._plan:
+      if not applies(data):
+        continue
+      # One subscript serves both the presence test and the value; absent fields take the
+      # KeyError branch
+      try:
+        value = data[field]
+      except KeyError:
+        if is_required:
+          errors[field] = MISSING_REQUIRED_MSG
+        else:
+          values[field] = RECOMMENDED_MSG
+        continue
+      error, warning = validate_field(value)
+      if error:
+        errors[field] = error
+      if warning:
+        warnings[field] = warning
+      values[field] = value
     return errors, warnings, values
 
-  def apply_schema(self, validator_schema, condition_schema, data, errors, warnings, values,
-                   is_required):
-    for field, validator in validator_schema.items():
-      condition = condition_schema.get(field,
-                                       "all")  # Default to "all" if no specific condition is set
-      if self.should_apply_validation(data, condition):
-        if field not in data and is_required:
-          errors[field] = "Missing required parameter"
-        elif field in data:
-          error, warning = validator.validate(data[field])
-          if error:
-            errors[field] = error
-          if warning:
-            warnings[field] = warning
-          values[field] = data[field]
-        elif not is_required:
-          values[field] = "Recommended to be specified"
-
-  def should_apply_validation(self, data, condition):
-    if condition == "all":
-      return True
-    elif isinstance(condition, dict):
-      for key, value in condition.items():
-        if isinstance(value, list):
-          if data.get(key) not in value:
-            return False
-        elif data.get(key) != value:
-          return False
-    return True
-
   def save_json(self, data, file_path):
-    with open(file_path, 'w') as file:
-      json.dump(data, file, indent=4)
+    # Serialize into one buffer and write it once. Keys keep schema order rather than being
+    # sorted. The two encoders do not produce identical bytes: orjson writes NaN/Infinity as
+    # null and formats some floats differently (3.4e-6 vs 3.4e-06, 1e16 vs 1e+16).
+    if orjson is not None:
+      content = _ORJSON_INDENT.sub(lambda match: b"\n" + match.group(1) * 2,
+                                   orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+      content = json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+    with open(file_path, 'wb') as file:
+      file.write(content)
+
+
+def load_json(file_path):
+  # orjson parses from bytes considerably faster than json.load; fall back to the
+  # standard library when it is not installed
+  if orjson is not None:
+    with open(file_path, 'rb') as file:
+      return orjson.loads(file.read())
+  with open(file_path, 'r') as file:
+    return json.load(file)
+
+
+# The schemas are fixed, so the validator objects are built once at import time
+# rather than on every call to main().
+REQUIRED_VALIDATOR_SCHEMA = {
+  "ArterialSpinLabelingType": StringValidator(allowed_values=["PASL", "(P)CASL", "PCASL"]),
+  "BackgroundSuppression": BooleanValidator(),
+  "M0Type": StringValidator(),
+  "TotalAcquiredPairs": NumberValidator(min_error=0),
+  "AcquisitionVoxelSize": NumberArrayValidator(size_error=3),
+  "LabelingDuration": NumberValidator(),
+  "PostLabelingDelay": NumberOrNumberArrayValidator(),
+  "InversionTime": NumberValidator(min_error=0),
+  "BolusCutOffTechnique": StringValidator(),
+  "BolusCutOffDelayTime": NumberOrNumberArrayValidator()
+}
+
+REQUIRED_CONDITION_SCHEMA = {
+  "ArterialSpinLabelingType": "all",
+  "BackgroundSuppression": "all",
+  "M0Type": "all",
+  "TotalAcquiredPairs": "all",
+  "AcquisitionVoxelSize": "all",
+  "LabelingDuration": {"ArterialSpinLabelingType": ["PCASL", "CASL"]},
+  "PostLabelingDelay": {"ArterialSpinLabelingType": ["PCASL", "CASL"]},
+  "InversionTime": {"ArterialSpinLabelingType": "PASL"},
+  "BolusCutOffTechnique": {"ArterialSpinLabelingType": "PASL"},
+  "BolusCutOffDelayTime": {"ArterialSpinLabelingType": "PASL"}
+}
+
+RECOMMENDED_VALIDATOR_SCHEMA = {
+  "BackgroundSuppressionNumberPulses": NumberValidator(min_error_include=0),
+  "BackgroundSuppressionPulseTime": NumberArrayValidator(min_error=0),
+  "LabelingLocationDescription": StringValidator(),
+  "VascularCrushingVENC": NumberOrNumberArrayValidator(min_error_include=0),
+  "PCASLType": StringValidator(allowed_values=["balanced", "unbalanced"]),
+  "CASLType": StringValidator(allowed_values=["single-coil", "double-coil"]),
+  "LabelingDistance": NumberValidator(),
+  "LabelingPulseAverageGradient": NumberValidator(min_error=0),
+  "LabelingPulseMaximumGradient": NumberValidator(min_error=0),
+  "LabelingPulseAverageB1": NumberValidator(min_error=0),
+  "LabelingPulseFlipAngle": NumberValidator(min_error=0, max_error_include=360),
+  "LabelingPulseInterval": NumberValidator(min_error=0),
+  "LabelingPulseDuration": NumberValidator(min_error=0),
+  "PASLType": StringValidator(),
+  "LabelingSlabThickness": NumberValidator(min_error_include=0)
+}
+
+RECOMMENDED_CONDITION_SCHEMA = {
+  "BackgroundSuppressionNumberPulses": {"BackgroundSuppression": True},
+  "BackgroundSuppressionPulseTime": {"BackgroundSuppression": True},
+  "LabelingLocationDescription": "all",
+  "VascularCrushingVENC": {"VascularCrushing": True},
+  "PCASLType": {"ArterialSpinLabelingType": "PCASL"},
+  "CASLType": {"ArterialSpinLabelingType": "CASL"},
+  "LabelingDistance": "all",
+  "LabelingPulseAverageGradient": {"ArterialSpinLabelingType": ["PCASL", "CASL"]},
+  "LabelingPulseMaximumGradient": {"ArterialSpinLabelingType": ["PCASL", "CASL"]},
+  "LabelingPulseAverageB1": {"ArterialSpinLabelingType": ["PCASL", "CASL"]},
+  "LabelingPulseFlipAngle": {"ArterialSpinLabelingType": ["PCASL", "CASL"]},
+  "LabelingPulseInterval": {"ArterialSpinLabelingType": ["PCASL", "CASL"]},
+  "LabelingPulseDuration": {"ArterialSpinLabelingType": ["PCASL", "CASL"]},
+  "PASLType": {"ArterialSpinLabelingType": "PASL"},
+  "LabelingSlabThickness": {"ArterialSpinLabelingType": "PASL"}
+}
 
 
 def main():
-  required_validator_schema = {
-    "ArterialSpinLabelingType": StringValidator(allowed_values=["PASL", "(P)CASL", "PCASL"]),
-    "BackgroundSuppression": BooleanValidator(),
-    "M0Type": StringValidator(),
-    "TotalAcquiredPairs": NumberValidator(min_error=0),
-    "AcquisitionVoxelSize": NumberArrayValidator(size_error=3),
-    "LabelingDuration": NumberValidator(),
-    "PostLabelingDelay": NumberOrNumberArrayValidator(),
-    "InversionTime": NumberValidator(min_error=0),
-    "BolusCutOffTechnique": StringValidator(),
-    "BolusCutOffDelayTime": NumberOrNumberArrayValidator()
-  }
-
-  required_condition_schema = {
-    "ArterialSpinLabelingType": "all",
-    "BackgroundSuppression": "all",
-    "M0Type": "all",
-    "TotalAcquiredPairs": "all",
-    "AcquisitionVoxelSize": "all",
-    "LabelingDuration": {"ArterialSpinLabelingType": ["PCASL", "CASL"]},
-    "PostLabelingDelay": {"ArterialSpinLabelingType": ["PCASL", "CASL"]},
-    "InversionTime": {"ArterialSpinLabelingType": "PASL"},
-    "BolusCutOffTechnique": {"ArterialSpinLabelingType": "PASL"},
-    "BolusCutOffDelayTime": {"ArterialSpinLabelingType": "PASL"}
-  }
-
-  recommended_validator_schema = {
-    "BackgroundSuppressionNumberPulses": NumberValidator(min_error_include=0),
-    "BackgroundSuppressionPulseTime": NumberArrayValidator(min_error=0),
-    "LabelingLocationDescription": StringValidator(),
-    "VascularCrushingVENC": NumberOrNumberArrayValidator(min_error_include=0),
-    "PCASLType": StringValidator(allowed_values=["balanced", "unbalanced"]),
-    "CASLType": StringValidator(allowed_values=["single-coil", "double-coil"]),
-    "LabelingDistance": NumberValidator(),
-    "LabelingPulseAverageGradient": NumberValidator(min_error=0),
-    "LabelingPulseMaximumGradient": NumberValidator(min_error=0),
-    "LabelingPulseAverageB1": NumberValidator(min_error=0),
-    "LabelingPulseFlipAngle": NumberValidator(min_error=0, max_error_include=360),
-    "LabelingPulseInterval": NumberValidator(min_error=0),
-    "LabelingPulseDuration": NumberValidator(min_error=0),
-    "PASLType": StringValidator(),
-    "LabelingSlabThickness": NumberValidator(min_error_include=0)
-  }
-
-  recommended_condition_schema = {
-    "BackgroundSuppressionNumberPulses": {"BackgroundSuppression": True},
-    "BackgroundSuppressionPulseTime": {"BackgroundSuppression": True},
-    "LabelingLocationDescription": "all",
-    "VascularCrushingVENC": {"VascularCrushing": True},
-    "PCASLType": {"ArterialSpinLabelingType": "PCASL"},
-    "CASLType": {"ArterialSpinLabelingType": "CASL"},
-    "LabelingDistance": "all",
-    "LabelingPulseAverageGradient": {"ArterialSpinLabelingType": ["PCASL", "CASL"]},
-    "LabelingPulseMaximumGradient": {"ArterialSpinLabelingType": ["PCASL", "CASL"]},
-    "LabelingPulseAverageB1": {"ArterialSpinLabelingType": ["PCASL", "CASL"]},
-    "LabelingPulseFlipAngle": {"ArterialSpinLabelingType": ["PCASL", "CASL"]},
-    "LabelingPulseInterval": {"ArterialSpinLabelingType": ["PCASL", "CASL"]},
-    "LabelingPulseDuration": {"ArterialSpinLabelingType": ["PCASL", "CASL"]},
-    "PASLType": {"ArterialSpinLabelingType": "PASL"},
-    "LabelingSlabThickness": {"ArterialSpinLabelingType": "PASL"}
-  }
-
-  json_validator = JSONValidator(required_validator_schema, required_condition_schema,
-                                 recommended_validator_schema, recommended_condition_schema)
+  json_validator = JSONValidator(REQUIRED_VALIDATOR_SCHEMA, REQUIRED_CONDITION_SCHEMA,
+                                 RECOMMENDED_VALIDATOR_SCHEMA, RECOMMENDED_CONDITION_SCHEMA)
   data_path = "sub-Sub1_asl_2.json"
   try:
-    with open(data_path, 'r') as file:
-      data = json.load(file)
+    data = load_json(data_path)
   except Exception as e:
     print(f"Error reading file: {str(e)}")
     return
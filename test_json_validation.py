@@ -0,0 +1,51 @@
+import json
+import os
+import tempfile
+import unittest
+
+from json_validation import (JSONValidator, MISSING_REQUIRED_MSG, RECOMMENDED_CONDITION_SCHEMA,
+                             RECOMMENDED_VALIDATOR_SCHEMA, REQUIRED_CONDITION_SCHEMA,
+                             REQUIRED_VALIDATOR_SCHEMA)
+
+
+class ValidateManyTest(unittest.TestCase):
+  def setUp(self):
+    self.validator = JSONValidator(REQUIRED_VALIDATOR_SCHEMA, REQUIRED_CONDITION_SCHEMA,
+                                   RECOMMENDED_VALIDATOR_SCHEMA, RECOMMENDED_CONDITION_SCHEMA)
+    self.tmp_dir = tempfile.TemporaryDirectory()
+    self.addCleanup(self.tmp_dir.cleanup)
+
+  def write_json(self, name, data):
+    path = os.path.join(self.tmp_dir.name, name)
+    with open(path, 'w') as file:
+      json.dump(data, file)
+    return path
+
+  def test_valid_sidecar(self):
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sub-Sub1_asl_2.json")
+    with open(path, 'r') as file:
+      expected = self.validator.validate(json.load(file))
+    self.assertEqual(self.validator.validate_many([path]), [(expected, None)])
+
+  def test_failures_are_reported_per_file(self):
+    paths = [
+      os.path.join(self.tmp_dir.name, "missing.json"),
+      self.write_json("array.json", [1, 2, 3]),
+      self.write_json("string_number.json", {"TotalAcquiredPairs": "10"}),
+      self.write_json("empty.json", {}),
+    ]
+    results = self.validator.validate_many(paths, max_workers=2)
+
+    self.assertEqual(len(results), len(paths))
+    self.assertIsNone(results[0][0])
+    self.assertTrue(results[0][1].startswith("Error reading file:"))
+    for result, error in results[1:3]:
+      self.assertIsNone(result)
+      self.assertTrue(error.startswith("Error validating file:"))
+    (errors, warnings, values), error = results[3]
+    self.assertIsNone(error)
+    self.assertEqual(errors["ArterialSpinLabelingType"], MISSING_REQUIRED_MSG)
+
+
+if __name__ == "__main__":
+  unittest.main()
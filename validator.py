@@ -1,4 +1,41 @@
+import operator
+
+# Bound checks shared by the number validators, as (keyword, comparison, message) rows. A rule
+# is added for every keyword argument that is not None, in the order listed here.
+NUMBER_ERROR_RULES = (
+  ("min_error", operator.gt, "Value must be > {}"),
+  ("max_error", operator.lt, "Value must be < {}"),
+  ("min_error_include", operator.ge, "Value must be >= {}"),
+  ("max_error_include", operator.le, "Value must be <= {}"),
+)
+NUMBER_WARNING_RULES = (
+  ("min_warning", operator.gt, "Value is unusually low ({})"),
+  ("max_warning", operator.lt, "Value is unusually high ({})"),
+)
+NUMBER_ARRAY_ERROR_RULES = (
+  ("min_error", operator.gt, "All numbers must be > {}"),
+  ("max_error", operator.lt, "All numbers must be < {}"),
+  ("min_error_include", operator.ge, "All numbers must be >= {}"),
+)
+NUMBER_ARRAY_WARNING_RULES = (
+  ("min_warning", operator.gt, "Some numbers may be unusually low ({})"),
+  ("max_warning", operator.lt, "Some numbers may be unusually high ({})"),
+)
+
+
+def compare_number(compare, bound):
+  return lambda x: compare(x, bound)
+
+
+def compare_each_number(compare, bound):
+  return lambda x: all(compare(i, bound) for i in x if isinstance(i, (int, float)))
+
+
 class BaseValidator:
+  # Validators are built once per schema and called for every field of every sidecar, so keep
+  # instances free of a per-object __dict__
+  __slots__ = ("error_rules", "warning_rules")
+
   def __init__(self):
     self.error_rules = []
     self.warning_rules = []
@@ -9,6 +46,14 @@ class BaseValidator:
   def add_warning_rule(self, func, warning_msg):
     self.warning_rules.append((func, warning_msg))
 
+  def add_bound_rules(self, bounds, error_rules, warning_rules, make_check):
+    for add_rule, rules in ((self.add_error_rule, error_rules),
+                            (self.add_warning_rule, warning_rules)):
+      for name, compare, msg in rules:
+        bound = bounds[name]
+        if bound is not None:
+          add_rule(make_check(compare, bound), msg.format(bound))
+
   def validate(self, value):
     for func, error_msg in self.error_rules:
       if not func(value):
@@ -20,32 +65,32 @@ class BaseValidator:
 
 
 class NumberValidator(BaseValidator):
+  __slots__ = ()
+
   def __init__(self, min_error=None, max_error=None, min_warning=None, max_warning=None,
                min_error_include=None, max_error_include=None):
     super().__init__()
-    if min_error is not None:
-      self.add_error_rule(lambda x: x > min_error, f"Value must be > {min_error}")
-    if max_error is not None:
-      self.add_error_rule(lambda x: x < max_error, f"Value must be < {max_error}")
-    if min_error_include is not None:
-      self.add_error_rule(lambda x: x >= min_error_include, f"Value must be >= {min_error_include}")
-    if max_error_include is not None:
-      self.add_error_rule(lambda x: x <= max_error_include, f"Value must be <= {max_error_include}")
-    if min_warning is not None:
-      self.add_warning_rule(lambda x: x > min_warning, f"Value is unusually low ({min_warning})")
-    if max_warning is not None:
-      self.add_warning_rule(lambda x: x < max_warning,
-                            f"Value is unusually high ({max_warning})")
+    bounds = {"min_error": min_error, "max_error": max_error, "min_warning": min_warning,
+              "max_warning": max_warning, "min_error_include": min_error_include,
+              "max_error_include": max_error_include}
+    self.add_bound_rules(bounds, NUMBER_ERROR_RULES, NUMBER_WARNING_RULES, compare_number)
 
 
 class StringValidator(BaseValidator):
+  __slots__ = ()
+
   def __init__(self, allowed_values=None):
     super().__init__()
     if allowed_values:
-      self.add_error_rule(lambda x: x in allowed_values, f"Value must be one of {allowed_values}")
+      # Hash lookup for the membership test; the message keeps the caller's ordering
+      allowed = frozenset(allowed_values)
+      self.add_error_rule(lambda x: isinstance(x, str) and x in allowed,
+                          f"Value must be one of {allowed_values}")
 
 
 class NumberArrayValidator(BaseValidator):
+  __slots__ = ()
+
   def __init__(self, size_error=None, min_error=None, max_error=None, min_warning=None,
                max_warning=None, min_error_include=None, check_ascending=False):
     super().__init__()
@@ -57,24 +102,10 @@ class NumberArrayValidator(BaseValidator):
           x) == size_error,
         f"Array must consist of exactly {size_error} numbers")
 
-    if min_error is not None:
-      self.add_error_rule(lambda x: all(i > min_error for i in x if isinstance(i, (int, float))),
-                          f"All numbers must be > {min_error}")
-    if max_error is not None:
-      self.add_error_rule(lambda x: all(i < max_error for i in x if isinstance(i, (int, float))),
-                          f"All numbers must be < {max_error}")
-    if min_error_include is not None:
-      self.add_error_rule(
-        lambda x: all(i >= min_error_include for i in x if isinstance(i, (int, float))),
-        f"All numbers must be >= {min_error_include}")
-    if min_warning is not None:
-      self.add_warning_rule(
-        lambda x: all(i > min_warning for i in x if isinstance(i, (int, float))),
-        f"Some numbers may be unusually low ({min_warning})")
-    if max_warning is not None:
-      self.add_warning_rule(
-        lambda x: all(i < max_warning for i in x if isinstance(i, (int, float))),
-        f"Some numbers may be unusually high ({max_warning})")
+    bounds = {"min_error": min_error, "max_error": max_error, "min_warning": min_warning,
+              "max_warning": max_warning, "min_error_include": min_error_include}
+    self.add_bound_rules(bounds, NUMBER_ARRAY_ERROR_RULES, NUMBER_ARRAY_WARNING_RULES,
+                         compare_each_number)
 
     # Optionally validate that the numbers in the array are in ascending order
     if check_ascending:
@@ -84,6 +115,8 @@ class NumberArrayValidator(BaseValidator):
 
 
 class NumberOrNumberArrayValidator(BaseValidator):
+  __slots__ = ("array_validator",)
+
   def __init__(self, size_error=None, min_error=None, max_error=None, min_warning=None,
                max_warning=None, min_error_include=None, check_ascending=False):
     super().__init__()
@@ -108,6 +141,8 @@ class NumberOrNumberArrayValidator(BaseValidator):
 
 
 class BooleanValidator(BaseValidator):
+  __slots__ = ()
+
   def __init__(self):
     super().__init__()
     self.add_error_rule(lambda x: isinstance(x, bool), "Value must be a boolean (True or False)")